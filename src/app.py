@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import os
 import pathlib
+import signal
 
 import discord
 from discord import app_commands, Object
@@ -20,19 +22,35 @@ logging.basicConfig(
 intents = discord.Intents.all()
 client = discord.Client(intents=intents)
 tree = app_commands.CommandTree(client)
+vc_observer: VcObserver | None = None
+# Kept so the close task isn't garbage collected (the event loop only keeps weak references).
+close_task: asyncio.Task | None = None
+
+
+def on_sigterm() -> None:
+    """`Client.run()` doesn't handle SIGTERM (`docker stop`, `systemctl stop`): close cleanly so VcObserver saves."""
+    global close_task
+    close_task = asyncio.create_task(client.close())
 
 
 @client.event
 async def on_ready():
+    global vc_observer
     logging.info("Bot is ready.")
-    # Start observing VCs in the specified guild
-    VcObserver(
-        bot=client,
-        tree=tree,
-        filepath=pathlib.Path("./vc_time_elapsed.json")
-    )
-    # Register slash commands for this guild only
-    await tree.sync(guild=Object(id=GUILD_ID))
+    # `on_ready` can fire more than once (e.g. after a failed RESUME): only observe once.
+    if vc_observer is None:
+        # Start observing VCs in the specified guild
+        vc_observer = VcObserver(
+            bot=client,
+            tree=tree,
+            filepath=pathlib.Path("./vc_time_elapsed.db")
+        )
+        # Register slash commands for this guild only
+        await tree.sync(guild=Object(id=GUILD_ID))
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, on_sigterm)
+        except NotImplementedError:
+            pass  # Windows
     await client.change_presence(activity=discord.Game("The Cave is waiting for you 👀"))
 
 
@@ -2,14 +2,16 @@
 # Date: 2025-04-17 (YYYY-MM-DD)
 # Author: Urpagin
 import asyncio
+import functools
+import heapq
 import json
 import logging
 import pathlib
-from datetime import datetime, timezone
+import sqlite3
+import time
 from json import JSONDecodeError
-from typing import Optional
+from typing import Iterable, Optional
 
-import discord
 from discord import Client, Member, VoiceState, VoiceChannel, Interaction, Object, Guild, Embed
 from discord.app_commands import CommandTree
 
@@ -25,24 +27,37 @@ class VcObserver:
 
         :param bot: The Discord bot instance.
         :param tree: To register slashcommands.
-        :param filepath: The path/name of the **JSON** file where all the elapsed times will be saved.
+        :param filepath: The path/name of the **SQLite** database file where all the elapsed times will be saved.
         :param guild_ids: Specify a list of guild IDs to only monitor those servers.
         """
-        if filepath.suffix.lower() != '.json':
-            raise ValueError(f"Expected a .json file, got: {filepath.name}")
+        if filepath.suffix.lower() not in ('.db', '.sqlite', '.sqlite3'):
+            raise ValueError(f"Expected a .db, .sqlite or .sqlite3 file, got: {filepath.name}")
 
         self._bot = bot
         self._tree = tree
         self.filepath = filepath
+        self._db: sqlite3.Connection = self._open_db()
+        # In-memory copy of the database, all stats queries are served from it.
+        self._data: dict[int, dict[int, float]] = self._read_file()
+        # Time added to `_data` since the last flush: { (user_id, vc_id): elapsed_secs, ... }
+        self._pending: dict[tuple[int, int], float] = dict()
+        self._file_lock = asyncio.Lock()
         # Filter guilds.
         self._guild_ids = guild_ids if guild_ids else [g.id for g in bot.guilds]
 
         # Dict like so: { user_id: (voice_channel_id, time_connected_seconds), ... }
-        self._connected_members: dict[int, tuple[int, datetime]] = dict()
+        # `time_connected_seconds` comes from `time.monotonic()`: only meaningful for computing elapsed times.
+        self._connected_members: dict[int, tuple[int, float]] = dict()
 
         # The embed color for showing stats of a single member.
         self.EMBED_MEMBER_STATS_COLOR: int = 0x2ECC71  # green
         self.EMBED_LEADERBOARD_COLOR: int = 0x3498DB  # blue
+        # How often pending times are written to the database.
+        self.FLUSH_INTERVAL_SECS: float = 30.0
+
+        # Persistence first: every instance that may receive voice events must also be able to save them.
+        self._flush_task: asyncio.Task = asyncio.create_task(self._periodic_flush())
+        self._hook_close()
 
         self._init_scan()
         self._register_events()
@@ -57,6 +72,9 @@ class VcObserver:
 
         This addresses the edge case where members were already connected before the bot started.
         """
+        # One clock read for the whole scan.
+        now: float = time.monotonic()
+
         for g_id in self._guild_ids:
             guild: Guild | None = self._bot.get_guild(g_id)
 
@@ -65,115 +83,213 @@ class VcObserver:
                 continue
 
             for vc in guild.voice_channels:
-                for member in vc.members:
-                    if member.bot:
-                        continue  # Skip bots
-
+                # Skip bots
+                for member in (m for m in vc.members if not m.bot):
                     logging.debug(f"User '{member.name}' was already in a VC before observing.")
 
-                    self._connected_members[member.id] = (
-                        vc.id,
-                        datetime.now(timezone.utc)
-                    )
+                    self._connected_members[member.id] = (vc.id, now)
 
-    def _read_file(self) -> dict[str, dict[str, float]]:
-        """Returns the parsed JSON contents of the `self.filepath` file."""
-        # Ensure file exists with initial content.
-        if not self.filepath.exists():
-            self.filepath.write_text('{}', encoding='utf-8')
+    def _open_db(self) -> sqlite3.Connection:
+        """
+        Opens the SQLite database at `self.filepath`, creating it and its tables if needed.
 
-        # Load JSON in memory.
-        with self.filepath.open('r', encoding='utf-8') as f:
-            try:
-                # This is because JSON keys MUST be strings.
-                # source: https://www.w3schools.com/js/js_json_objects.asp
+        If a JSON file from older versions sits next to it (same name, `.json` extension)
+        and has not been imported yet, its contents are imported.
+        """
+        # Autocommit: transactions are opened explicitly.
+        # Writes happen in a worker thread (see `_write_sync()`), serialized by `_file_lock`.
+        db = sqlite3.connect(self.filepath, isolation_level=None, check_same_thread=False)
+        # WAL + NORMAL: appends to the log instead of rewriting pages, no fsync on every commit.
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS vc_time ("
+            "user_id INTEGER, vc_id INTEGER, secs REAL, "
+            "PRIMARY KEY(user_id, vc_id))"
+        )
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+        # A failed import is retried on every start until the `meta` row says it is done.
+        legacy_path = self.filepath.with_suffix('.json')
+        is_imported: bool = db.execute(
+            "SELECT 1 FROM meta WHERE key = 'legacy_json_imported'"
+        ).fetchone() is not None
+        if not is_imported and legacy_path.exists():
+            self._import_legacy_json(db, legacy_path)
+
+        return db
+
+    @staticmethod
+    def _import_legacy_json(db: sqlite3.Connection, legacy_path: pathlib.Path) -> None:
+        """Imports the `{ user_id: { vc_id: secs } }` JSON file used by older versions into `db`."""
+        try:
+            with legacy_path.open('r', encoding='utf-8') as f:
                 json_data: dict[str, dict[str, float]] = json.load(f)
-            except JSONDecodeError:
-                logging.error(f"Failed to decode JSON file '{self.filepath}'")
-                json_data = dict()
-            except Exception as e:
-                logging.error(f"Error while trying to load JSON: {e}")
-                json_data = dict()
+        except (OSError, JSONDecodeError) as e:
+            logging.error(f"Failed to import legacy JSON file '{legacy_path}': {e}")
+            return
+
+        try:
+            rows = [
+                (int(user_id_str), int(vc_id_str), float(secs))
+                for user_id_str, vc_times in json_data.items()
+                for vc_id_str, secs in vc_times.items()
+            ]
+        except (ValueError, TypeError, AttributeError) as e:
+            logging.error(f"Unexpected content in legacy JSON file '{legacy_path}', not imported: {e}")
+            return
+
+        # Merged with what was recorded since (e.g. after a failed import), and marked as done in the same transaction.
+        try:
+            with db:
+                db.execute("BEGIN")
+                db.executemany(
+                    "INSERT INTO vc_time(user_id, vc_id, secs) VALUES(?, ?, ?) "
+                    "ON CONFLICT(user_id, vc_id) DO UPDATE SET secs = secs + excluded.secs",
+                    rows
+                )
+                db.execute("INSERT INTO meta(key, value) VALUES('legacy_json_imported', ?)", (str(legacy_path),))
+        except sqlite3.Error as e:
+            logging.error(f"Failed to import legacy JSON file '{legacy_path}': {e}")
+            return
+
+        logging.info(f"Imported {len(rows)} entries from legacy JSON file '{legacy_path}'.")
 
-        return json_data
+    def _read_file(self) -> dict[int, dict[int, float]]:
+        """Loads the whole database as `{ user_id: { vc_id: elapsed_secs } }` in a single query."""
+        data: dict[int, dict[int, float]] = dict()
+        for user_id, vc_id, secs in self._db.execute("SELECT user_id, vc_id, secs FROM vc_time"):
+            data.setdefault(user_id, {})[vc_id] = secs
+        return data
 
     def _update_file(self, member_id: int, vc_id: int, elapsed_secs: float) -> None:
         """
-        Updates the JSON file: updates elapsed times for `member`, adds an entry if not in file.
-        :param member_id: The member to update in the file.
+        Adds `elapsed_secs` to the time of `member_id` in `vc_id`, adds an entry if missing.
+        The change is applied in memory right away and written to the database by the next `_flush()`.
+        :param member_id: The member to update.
         :param vc_id: The Snowflake ID of the Voice Channel `member` was in.
         :param elapsed_secs: How much time in seconds with microsecond precision `member` passed in the VC.
         """
+        vc_times = self._data.get(member_id)
+        if vc_times is None:
+            vc_times = self._data[member_id] = {}
+        vc_times[vc_id] = vc_times.get(vc_id, 0.0) + elapsed_secs
+
+        key = (member_id, vc_id)
+        self._pending[key] = self._pending.get(key, 0.0) + elapsed_secs
+
+    async def _periodic_flush(self) -> None:
+        """Calls `_flush()` every `FLUSH_INTERVAL_SECS`, until cancelled."""
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL_SECS)
+            try:
+                await self._flush()
+            except Exception as e:
+                logging.error(f"Failed to write VC times to the database: {e}")
 
-        # Load file contents into memory
-        json_data: dict[str, dict[str, float]] = self._read_file()
+    async def _flush(self) -> None:
+        """
+        Writes the pending times to the database, all at once.
+        The write itself runs in a worker thread so the event loop is never blocked on disk I/O.
+        `_file_lock` only keeps flushes (periodic and on close) from overlapping.
+        """
+        async with self._file_lock:
+            if not self._pending:
+                return
 
-        member_id_str = str(member_id)
-        vc_id_str = str(vc_id)
+            rows = [(user_id, vc_id, secs) for (user_id, vc_id), secs in self._pending.items()]
+            # Times added while writing belong to the next flush.
+            self._pending = dict()
 
-        # Add new or update existing.
-        json_data.setdefault(member_id_str, {})
-        json_data[member_id_str][vc_id_str] = json_data[member_id_str].get(vc_id_str, 0.0) + elapsed_secs
+            try:
+                await asyncio.to_thread(self._write_sync, rows)
+            except Exception:
+                # Keep them for the next attempt.
+                for user_id, vc_id, secs in rows:
+                    key = (user_id, vc_id)
+                    self._pending[key] = self._pending.get(key, 0.0) + secs
+                raise
+
+    def _hook_close(self) -> None:
+        """
+        Makes `bot.close()` flush the pending times and close the database first, so nothing is lost on shutdown.
+        Signals are left to the host bot (see `src/app.py` for SIGTERM).
+        """
+        close = self._bot.close
+        closed: bool = False
 
-        # The warning is supposed to be a false-positive.
-        # Because TextIO supports SupportsWrite[str]
-        with self.filepath.open('w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=4)
+        async def close_and_flush() -> None:
+            nonlocal closed
+            if not closed:
+                closed = True
+                try:
+                    await self._flush()
+                except Exception as e:
+                    logging.error(f"Failed to write VC times to the database on shutdown: {e}")
+                # No `await` from here on: the periodic flush cannot start a write on the closing database.
+                self._flush_task.cancel()
+                self._db.close()
+            await close()
+
+        self._bot.close = close_and_flush
+
+    def _write_sync(self, rows: list[tuple[int, int, float]]) -> None:
+        """Blocking: adds the `(user_id, vc_id, secs)` rows to the stored times in a single transaction."""
+        # A transaction is atomic: a crash mid-write leaves the previous state intact.
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO vc_time(user_id, vc_id, secs) VALUES(?, ?, ?) "
+                "ON CONFLICT(user_id, vc_id) DO UPDATE SET secs = secs + excluded.secs",
+                rows
+            )
 
     def _handle_connected(self, member: Member, vc: VoiceChannel) -> None:
         """The logic when `member` connects to a VC"""
-        assert vc and member
-
         self._connected_members[member.id] = (
             vc.id,
-            datetime.now(timezone.utc)
+            time.monotonic()
         )
 
-    def _handle_disconnected(self, member: Member, vc: VoiceChannel) -> None:
+    def _handle_disconnected(self, member: Member, vc: VoiceChannel | None) -> None:
         """The logic when `member` disconnects from a VC"""
-        assert vc and member
+        if vc is None:
+            return
 
-        cached_member = self._connected_members.get(member.id, None)
+        # Removing the entry right away prevents stale entries.
+        cached_member = self._connected_members.pop(member.id, None)
         if cached_member is None:
             logging.warning("A user disconnected without having been monitored.")
             return
 
-        delta_time_secs: float = (datetime.now(timezone.utc) - cached_member[1]).total_seconds()
+        delta_time_secs: float = time.monotonic() - cached_member[1]
         self._update_file(member.id, vc.id, delta_time_secs)
-        # Prevent stale entries.
-        del self._connected_members[member.id]
 
     @staticmethod
     def _is_in_vc(member: Member, vc: VoiceChannel | None) -> bool:
         """Returns ``True`` if `member` is inside `vc`, otherwise False."""
-        return member in vc.members if vc else False
+        return (vc is not None and member.voice is not None and member.voice.channel is not None
+                and member.voice.channel.id == vc.id)
 
-    async def _get_vc_from_id(self, vc_id: int | str) -> VoiceChannel | None:
+    def _get_vc_from_id(self, vc_id: int | str) -> VoiceChannel | None:
         """
         Returns a VoiceChannel object if the given ID corresponds to an existing voice channel;
         otherwise returns None.
 
         Behavior:
-        - Try to retrieve the channel from cache.
-        - If not found, fetch it from Discord.
-        - Return None if it doesn't exist or is not a VoiceChannel.
+        - Retrieve the channel from the client cache, without any HTTP request, so embeds stay fast.
+        - Return None if it isn't cached (deleted) or is not a VoiceChannel.
 
         Guarantee: If the result is not None, it is a valid VoiceChannel.
         """
         vc_id_int: int = int(vc_id) if isinstance(vc_id, str) else vc_id
 
         channel = self._bot.get_channel(vc_id_int)
-        if channel is None:
-            try:
-                channel = await self._bot.fetch_channel(vc_id_int)
-            except discord.NotFound:
-                channel = None
-
         if isinstance(channel, VoiceChannel):
             return channel
         return None
 
-    async def _get_member_stats(self, member: Member | int) -> dict[VoiceChannel, float]:
+    def _get_member_stats(self, member: Member | int) -> dict[VoiceChannel, float]:
         """
         Retrieves voice channel statistics for a given member.
 
@@ -186,61 +302,27 @@ class VcObserver:
         :return: A dictionary mapping `VoiceChannel` objects to the time spent in each, in seconds.
         """
 
-        # JSON object keys must be strings, so we convert the user ID.
-        user_id_str: str = str(member) if isinstance(member, int) else str(member.id)
-
-        # What we'll return.
-        res: dict[VoiceChannel, float] = dict()
+        user_id: int = member if isinstance(member, int) else member.id
+        vc_times: dict[int, float] = self._data.get(user_id, {})
 
-        # Load JSON into memory
-        json_data: dict[str, dict[str, float]] = self._read_file()
-        if user_id_str not in json_data:
-            return res  # No stats recorded for this user
+        vcs: dict[int, VoiceChannel] = self._resolve_vcs(vc_times)
+        return self._map_vc_times(vc_times, vcs)
 
-        for vc_id_str, t_elapsed in json_data[user_id_str].items():
-            # VC deleted if None
-            vc: VoiceChannel | None = await self._get_vc_from_id(vc_id_str)
-            if vc is not None:
-                res[vc] = t_elapsed
-
-        return res
-
-    async def _get_members_stats(self, guild: Guild | int) -> dict[Member, dict[VoiceChannel, float]]:
+    def _resolve_vcs(self, vc_ids: Iterable[int]) -> dict[int, VoiceChannel]:
         """
-        Retrieves voice channel statistics for all members in the specified guild.
-
-        This method returns a mapping of each member to a dictionary containing
-        the total time (in seconds, with microsecond precision) they have spent
-        in each voice channel they have connected to.
-
-        Members are not included in the result if they have no stats from the JSON file.
-
-        Note: **Deleted voice channels are not included in the result.**
-
-        :param guild: A `discord.Guild` instance or the guild's Snowflake ID (`int`).
-        :return: A dictionary mapping each `Member` to their per-channel voice activity.
+        Resolves every given VC ID, each ID at most once.
+        Deleted voice channels are left out.
         """
+        vcs = {vc_id: self._get_vc_from_id(vc_id) for vc_id in set(vc_ids)}
+        return {vc_id: vc for vc_id, vc in vcs.items() if vc is not None}
 
-        # Make sure we have a `discord.Guild` object.
-        if isinstance(guild, Guild):
-            guild_obj = guild
-        else:
-            guild_obj = self._bot.get_guild(guild)
-            if guild_obj is None:
-                try:
-                    guild_obj = await self._bot.fetch_guild(guild)
-                except discord.NotFound:
-                    raise Exception(f"Guild not found while fetching the guild with id {guild}")
-
-        member_list = guild_obj.members
-        stats_list = await asyncio.gather(*(self._get_member_stats(m) for m in member_list))
-
-        # Only keep members with stats.
-        res: dict[Member, dict[VoiceChannel, float]] = {
-            member: stats for member, stats in zip(member_list, stats_list) if stats
-        }
-
-        return res
+    @staticmethod
+    def _map_vc_times(vc_times: dict[int, float], vcs: dict[int, VoiceChannel]) -> dict[VoiceChannel, float]:
+        """
+        Turns a `{ vc_id: elapsed_secs }` mapping into a `{ VoiceChannel: elapsed_secs }` one
+        using the VCs resolved by `_resolve_vcs()`. Deleted voice channels are left out.
+        """
+        return {vcs[vc_id]: t_elapsed for vc_id, t_elapsed in vc_times.items() if vc_id in vcs}
 
     @staticmethod
     def _format_time(t_secs: float) -> str:
@@ -251,7 +333,12 @@ class VcObserver:
             3661.0   -> '1h 1m 1s'
             0.5      -> '0s'
         """
-        seconds = int(round(t_secs))
+        return VcObserver._format_seconds(int(round(t_secs)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_seconds(seconds: int) -> str:
+        """Cached implementation of `_format_time()`, on whole seconds."""
         hours, remainder = divmod(seconds, 3600)
         minutes, seconds = divmod(remainder, 60)
 
@@ -267,7 +354,7 @@ class VcObserver:
 
     async def _build_embed_member(self, member: Member) -> Embed:
         """Builds the embed showing the stats of a single user."""
-        stats: dict[VoiceChannel, float] = await self._get_member_stats(member)
+        stats: dict[VoiceChannel, float] = self._get_member_stats(member)
 
         embed = Embed(
             title=f"Statistiques vocales pour {member.display_name}",
@@ -282,7 +369,7 @@ class VcObserver:
         # TODO: filter the ones outside of the member's guild.
         # Sort by descending order with the time as key.
         # Truncate to 25 (Discord allows up to 25 fields)
-        sorted_stats: list[tuple[VoiceChannel, float]] = sorted(stats.items(), key=lambda x: x[1], reverse=True)[:25]
+        sorted_stats: list[tuple[VoiceChannel, float]] = heapq.nlargest(25, stats.items(), key=lambda x: x[1])
 
         # In ALL VCs. (not truncated sum)
         total_time: float = sum(stats.values())
@@ -304,30 +391,6 @@ class VcObserver:
 
         return embed
 
-    @staticmethod
-    def _top_vc_with_total(stats: dict[VoiceChannel, float]) -> tuple[float, tuple[VoiceChannel, float]]:
-        """
-        Summarizes a member's voice activity.
-
-        Given a dictionary mapping voice channels to time spent (in seconds),
-        returns:
-          - The total time spent across all channels
-          - The voice channel where the member spent the most time, along with that time
-
-        If the input is empty, returns None.
-
-        :param stats: A dictionary mapping `VoiceChannel` objects to time spent (in seconds).
-        :return: A tuple (total_time, (top_channel, top_time)).
-        """
-        if not stats:
-            logging.warning("Got empty 'stats'")
-            raise Exception("Cannot parse empty 'stats'!")
-
-        total: float = sum(stats.values())
-        # max will error on empty stats; you may want to guard or define a default.
-        top_channel, top_time = max(stats.items(), key=lambda kv: kv[1])
-        return total, (top_channel, top_time)
-
     async def _build_embed_leaderboard(self, guild: Guild) -> Embed:
         """
         Builds and returns an embed displaying the voice activity leaderboard.
@@ -336,37 +399,55 @@ class VcObserver:
         Pagination should be used if the number of entries exceeds the embed field limit.
         :param guild: The guild for which the leaderboard will be built.
         """
-        stats: dict[Member, dict[VoiceChannel, float]] = await self._get_members_stats(guild)
-
         embed = Embed(
             title=f"Statistiques vocales globales",
             description="Temps passé dans les salons vocaux",
             color=self.EMBED_LEADERBOARD_COLOR
         )
 
-        # Complicated but sorts them just like in the other function.
-        # Max 25
-        sorted_stats = sorted(stats.items(), key=lambda x: sum(x[1].values()), reverse=True)[:25]
+        # Bots and members without recorded stats are skipped right away.
+        data: dict[int, dict[int, float]] = self._data
+        members: dict[int, Member] = {m.id: m for m in guild.members if not m.bot and m.id in data}
 
-        # The sum of all member stats.
-        total_time_global: float = sum(
-            time
-            for member_stats in stats.values()
-            for time in member_stats.values()
+        # Resolve each VC once for the whole guild, not once per member.
+        vcs: dict[int, VoiceChannel] = self._resolve_vcs(
+            vc_id for user_id in members for vc_id in data[user_id]
         )
 
+        # Single pass over the raw IDs: (user_id, total_time, top_vc_id, top_time) per member,
+        # and the sum of all member stats.
+        rows: list[tuple[int, float, int, float]] = []
+        total_time_global: float = 0.0
+        for user_id in members:
+            total_time: float = 0.0
+            top_vc_id: int = 0
+            top_time: float = -1.0
+            for vc_id, t_elapsed in data[user_id].items():
+                if vc_id not in vcs:
+                    continue  # VC deleted
+
+                total_time += t_elapsed
+                if t_elapsed > top_time:
+                    top_vc_id, top_time = vc_id, t_elapsed
+
+            if top_time < 0.0:
+                continue  # Only deleted VCs
+
+            rows.append((user_id, total_time, top_vc_id, top_time))
+            total_time_global += total_time
+
+        # Top 25 on the precomputed totals, sorted in descending order.
+        sorted_rows = heapq.nlargest(25, rows, key=lambda row: row[1])
+
         embed.set_footer(
             text=f"Temps total cumulé en vocal pour tous les membres : {self._format_time(total_time_global)}")
         if guild.icon:
             embed.set_thumbnail(url=guild.icon.url)
 
-        #   int, (Member, dict[VoiceChannel, float])
-        for idx, (member, vc_stats) in enumerate(sorted_stats, start=1):
-            if not vc_stats:
-                logging.warning("vc_stats is empty.")
-                continue
-
-            total_time, (top_vc, top_time) = self._top_vc_with_total(vc_stats)
+        # Objects are only looked up for the displayed rows.
+        for idx, (user_id, total_time, top_vc_id, top_time) in enumerate(sorted_rows, start=1):
+            member: Member = members[user_id]
+            top_vc: VoiceChannel = vcs[top_vc_id]
             percent = (total_time / total_time_global * 100) if total_time_global else 0.0
 
             value: str = (
@@ -385,6 +466,22 @@ class VcObserver:
     def _register_events(self):
         """Registers events to be notified when members do things."""
 
+        # The slash command goes first: if it is already registered (second instance), this raises
+        # before the voice events are taken over from the existing instance.
+        @self._tree.command(name="vc-leaderboard",
+                            description="Top des membres en vocal!",
+                            guilds=[Object(id=g) for g in self._guild_ids])
+        async def vc_leaderboard_command(ctx: Interaction, member: Optional[Member]):
+            d_member: str = 'None' if not member else member.name
+            logging.debug(f"User '{ctx.user.name}' used /vc-leaderboard command with member={d_member}")
+
+            if member:
+                embed: Embed = await self._build_embed_member(member)
+                await ctx.response.send_message(embed=embed)
+            else:
+                embed: Embed = await self._build_embed_leaderboard(ctx.guild)
+                await ctx.response.send_message(embed=embed)
+
         @self._bot.event
         async def on_voice_state_update(member: Member, before: VoiceState, after: VoiceState):
             """Is called whenever a member updates their states in a VC. E.g.: connects, disconnects, mutes, deafens, ..."""
@@ -420,17 +517,3 @@ class VcObserver:
                 # Joined a VC
                 logging.debug(f"User '{member.name}' joined VC '{vc_after.name}'")
                 self._handle_connected(member, vc_after)
-
-        @self._tree.command(name="vc-leaderboard",
-                            description="Top des membres en vocal!",
-                            guilds=[Object(id=g) for g in self._guild_ids])
-        async def vc_leaderboard_command(ctx: Interaction, member: Optional[Member]):
-            d_member: str = 'None' if not member else member.name
-            logging.debug(f"User '{ctx.user.name}' used /vc-leaderboard command with member={d_member}")
-
-            if member:
-                embed: Embed = await self._build_embed_member(member)
-                await ctx.response.send_message(embed=embed)
-            else:
-                embed: Embed = await self._build_embed_leaderboard(ctx.guild)
-                await ctx.response.send_message(embed=embed)